@@ -4,15 +4,21 @@ from itertools import zip_longest
 from typing import Any, Coroutine, Iterable, List
 
 
+# resolved lazily by asyncio_module, so tqdm import cost is paid once
+_tqdm_asyncio_module: Any = None
+
+
 def asyncio_module(show_progress: bool = False) -> Any:
-    if show_progress:
+    if not show_progress:
+        return asyncio
+
+    global _tqdm_asyncio_module
+    if _tqdm_asyncio_module is None:
         from tqdm.asyncio import tqdm_asyncio
 
-        module = tqdm_asyncio
-    else:
-        module = asyncio
+        _tqdm_asyncio_module = tqdm_asyncio
 
-    return module
+    return _tqdm_asyncio_module
 
 
 def run_async_tasks(
@@ -5,10 +5,8 @@ NOTE: These are beta functions, might change.
 """
 
 import asyncio
-from collections import defaultdict
 from typing import Any, List, Optional, Tuple
 
-import numpy as np
 import pandas as pd
 from llama_index.core.async_utils import asyncio_module
 from llama_index.core.base.base_query_engine import BaseQueryEngine
@@ -16,14 +14,31 @@ from llama_index.core.evaluation.base import EvaluationResult
 
 
 async def aget_responses(
-    questions: List[str], query_engine: BaseQueryEngine, show_progress: bool = False
+    questions: List[str],
+    query_engine: BaseQueryEngine,
+    show_progress: bool = False,
+    max_concurrency: int = 10,
 ) -> List[str]:
-    """Get responses."""
-    tasks = []
-    for question in questions:
-        tasks.append(query_engine.aquery(question))
+    """Get responses.
+
+    Queries are issued concurrently, with at most `max_concurrency`
+    in flight at once to avoid overwhelming the query engine backend.
+    Responses are consumed as they complete rather than held by a
+    single gather until the last one finishes.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _aquery(idx: int, question: str) -> Tuple[int, Any]:
+        async with semaphore:
+            return idx, await query_engine.aquery(question)
+
+    tasks = [_aquery(idx, question) for idx, question in enumerate(questions)]
     asyncio_mod = asyncio_module(show_progress=show_progress)
-    return await asyncio_mod.gather(*tasks)
+    responses: List[Any] = [None] * len(questions)
+    for future in asyncio_mod.as_completed(tasks):
+        idx, response = await future
+        responses[idx] = response
+    return responses
 
 
 def get_responses(
@@ -52,13 +67,25 @@ def get_results_df(
             List of metric keys to get.
 
     """
-    metric_dict = defaultdict(list)
-    metric_dict["names"] = names
-    for metric_key in metric_keys:
-        for eval_results in eval_results_list:
-            mean_score = np.array([r.score for r in eval_results[metric_key]]).mean()
-            metric_dict[metric_key].append(mean_score)
-    return pd.DataFrame(metric_dict)
+    # group on entry position rather than name, so duplicate names keep
+    # their own row and mean instead of being pooled together
+    rows = [
+        (entry, metric_key, result.score)
+        for entry, eval_results in enumerate(eval_results_list)
+        for metric_key in metric_keys
+        for result in eval_results[metric_key]
+    ]
+    scores_df = pd.DataFrame(rows, columns=["entry", "metric", "score"])
+    mean_df = (
+        scores_df.groupby(["entry", "metric"], sort=False)["score"]
+        .mean()
+        .unstack("metric")
+        .reindex(index=range(len(names)), columns=metric_keys)
+        .rename_axis(index=None, columns=None)
+        .reset_index(drop=True)
+    )
+    mean_df.insert(0, "names", names)
+    return mean_df
 
 
 def default_parser(eval_response: str) -> Tuple[Optional[float], Optional[str]]:
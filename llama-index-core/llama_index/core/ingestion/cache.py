@@ -1,7 +1,8 @@
-from typing import List, Optional
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 import fsspec
-from llama_index.core.bridge.pydantic import BaseModel, Field
+from llama_index.core.bridge.pydantic import BaseModel, Field, PrivateAttr
 from llama_index.core.schema import BaseNode
 from llama_index.core.storage.docstore.utils import doc_to_json, json_to_doc
 from llama_index.core.storage.kvstore import (
@@ -13,6 +14,8 @@ from llama_index.core.storage.kvstore.types import (
 
 DEFAULT_CACHE_NAME = "llama_cache"
 
+DEFAULT_LOCAL_CACHE_SIZE = 128
+
 
 class IngestionCache(BaseModel):
     class Config:
@@ -24,8 +27,29 @@ class IngestionCache(BaseModel):
         default=DEFAULT_CACHE_NAME, description="Collection name of the cache."
     )
     cache: BaseCache = Field(default_factory=SimpleCache, description="Cache to use.")
+    local_cache_size: int = Field(
+        default=DEFAULT_LOCAL_CACHE_SIZE,
+        description="Max number of recently used entries to keep in process.",
+    )
+
+    # LRU of recently seen payloads, so repeated lookups of the same key
+    # skip the round-trip to the backing KV store
+    _local_cache: "OrderedDict[Tuple[str, str], dict]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+
+    def _put_local(self, key: Tuple[str, str], val: dict) -> None:
+        self._local_cache[key] = val
+        self._local_cache.move_to_end(key)
+        while len(self._local_cache) > self.local_cache_size:
+            self._local_cache.popitem(last=False)
+
+    def _get_local(self, key: Tuple[str, str]) -> Optional[dict]:
+        val = self._local_cache.get(key)
+        if val is not None:
+            self._local_cache.move_to_end(key)
+        return val
 
-    # TODO: add async get/put methods?
     def put(
         self, key: str, nodes: List[BaseNode], collection: Optional[str] = None
     ) -> None:
@@ -34,19 +58,65 @@ class IngestionCache(BaseModel):
 
         val = {self.nodes_key: [doc_to_json(node) for node in nodes]}
         self.cache.put(key, val, collection=collection)
+        self._put_local((key, collection), val)
+
+    async def aput(
+        self, key: str, nodes: List[BaseNode], collection: Optional[str] = None
+    ) -> None:
+        """Put a value into the cache asynchronously."""
+        collection = collection or self.collection
+
+        val = {self.nodes_key: [doc_to_json(node) for node in nodes]}
+        await self.cache.aput(key, val, collection=collection)
+        self._put_local((key, collection), val)
 
     def get(
         self, key: str, collection: Optional[str] = None
     ) -> Optional[List[BaseNode]]:
         """Get a value from the cache."""
         collection = collection or self.collection
-        node_dicts = self.cache.get(key, collection=collection)
+        node_dicts = self._get_local((key, collection))
+        if node_dicts is None:
+            node_dicts = self.cache.get(key, collection=collection)
 
         if node_dicts is None:
             return None
 
+        self._put_local((key, collection), node_dicts)
         return [json_to_doc(node_dict) for node_dict in node_dicts[self.nodes_key]]
 
+    async def aget(
+        self, key: str, collection: Optional[str] = None
+    ) -> Optional[List[BaseNode]]:
+        """Get a value from the cache asynchronously."""
+        collection = collection or self.collection
+        node_dicts = self._get_local((key, collection))
+        if node_dicts is None:
+            node_dicts = await self.cache.aget(key, collection=collection)
+
+        if node_dicts is None:
+            return None
+
+        self._put_local((key, collection), node_dicts)
+        return [json_to_doc(node_dict) for node_dict in node_dicts[self.nodes_key]]
+
+    def mget(
+        self, keys: List[str], collection: Optional[str] = None
+    ) -> List[Optional[List[BaseNode]]]:
+        """Get multiple values from the cache in one pass.
+
+        The default implementation loops over get(); backends with a
+        pipelined multi-get can override this to collapse the round trips
+        into one.
+        """
+        return [self.get(key, collection=collection) for key in keys]
+
+    async def amget(
+        self, keys: List[str], collection: Optional[str] = None
+    ) -> List[Optional[List[BaseNode]]]:
+        """Get multiple values from the cache asynchronously in one pass."""
+        return [await self.aget(key, collection=collection) for key in keys]
+
     def clear(self, collection: Optional[str] = None) -> None:
         """Clear the cache."""
         collection = collection or self.collection
@@ -54,6 +124,8 @@ class IngestionCache(BaseModel):
         for key in data:
             self.cache.delete(key, collection=collection)
 
+        self._local_cache.clear()
+
     def persist(
         self, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
     ) -> None:
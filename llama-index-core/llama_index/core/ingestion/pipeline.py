@@ -1,17 +1,30 @@
 import asyncio
+import json
+import logging
 import multiprocessing
 import re
 import warnings
 from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from functools import partial, reduce
-from hashlib import sha256
-from itertools import repeat
+from hashlib import blake2b
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Any, Generator, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from fsspec import AbstractFileSystem
-from llama_index.core.bridge.pydantic import BaseModel, Field
+from llama_index.core.bridge.pydantic import BaseModel, Field, PrivateAttr
 from llama_index.core.ingestion.cache import DEFAULT_CACHE_NAME, IngestionCache
 from llama_index.core.node_parser import SentenceSplitter
 from llama_index.core.readers.base import ReaderConfig
@@ -30,6 +43,21 @@ from llama_index.core.storage.storage_context import DOCSTORE_FNAME
 from llama_index.core.utils import concat_dirs
 from llama_index.core.vector_stores.types import BasePydanticVectorStore
 
+logger = logging.getLogger(__name__)
+
+_UNSTABLE_PATTERN = re.compile(r"<[\w\s_\. ]+ at 0x[a-z0-9]+>")
+
+# cache keys only need collision resistance, not cryptographic strength,
+# so prefer blake3's SIMD kernels when available and fall back to blake2b
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = partial(blake2b, digest_size=32)
+
+# prefix for transformation cache keys, bumped whenever the hashing
+# scheme changes so stale entries miss cleanly
+_CACHE_KEY_VERSION = "v3"
+
 
 def remove_unstable_values(s: str) -> str:
     """Remove unstable key/value pairs.
@@ -38,22 +66,76 @@ def remove_unstable_values(s: str) -> str:
     - <__main__.Test object at 0x7fb9f3793f50>
     - <function test_fn at 0x7fb9f37a8900>
     """
-    pattern = r"<[\w\s_\. ]+ at 0x[a-z0-9]+>"
-    return re.sub(pattern, "", s)
+    if "0x" not in s:
+        return s
+    return _UNSTABLE_PATTERN.sub("", s)
+
+
+def get_transformation_str(transformation: TransformComponent) -> str:
+    """Get a stable string representation of a transformation's config.
+
+    Canonical JSON with sorted keys keeps the string deterministic across
+    dict orderings; values that aren't JSON-serializable fall back to their
+    repr, so the unstable-value strip still applies to those.
+    """
+    transformation_dict = transformation.to_dict()
+    try:
+        transform_string = json.dumps(transformation_dict, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        transform_string = str(transformation_dict)
+    return remove_unstable_values(transform_string)
+
+
+def _nodes_digest(
+    nodes: List[BaseNode], cache: Optional[Dict[str, bytes]] = None
+) -> bytes:
+    """Get a single digest over the rendered content of a list of nodes.
+
+    Per-node digests are memoized in `cache` (keyed on node id), so repeated
+    calls over the same nodes skip re-rendering and re-hashing their content.
+    """
+    root = _hasher()
+    for node in nodes:
+        digest = cache.get(node.node_id) if cache is not None else None
+        if digest is None:
+            digest = _hasher(
+                node.get_content(metadata_mode=MetadataMode.ALL).encode(
+                    "utf-8", "ignore"
+                )
+            ).digest()
+            if cache is not None:
+                cache[node.node_id] = digest
+        root.update(digest)
+
+    return root.digest()
 
 
 def get_transformation_hash(
-    nodes: List[BaseNode], transformation: TransformComponent
+    nodes: List[BaseNode],
+    transformation: TransformComponent,
+    node_digest_cache: Optional[Dict[str, bytes]] = None,
+    prev_hash: Optional[str] = None,
+    transform_str: Optional[str] = None,
 ) -> str:
-    """Get the hash of a transformation."""
-    nodes_str = "".join(
-        [str(node.get_content(metadata_mode=MetadataMode.ALL)) for node in nodes]
-    )
+    """Get the hash of a transformation.
 
-    transformation_dict = transformation.to_dict()
-    transform_string = remove_unstable_values(str(transformation_dict))
+    If `prev_hash` is given, the nodes are assumed to be the output of the
+    previously hashed transformation step, so their contents are folded in
+    via that constant-size digest instead of being re-hashed from scratch.
+    A precomputed `transform_str` (see `get_transformation_str`) can be
+    passed in to skip re-serializing the transformation's config.
+    """
+    h = _hasher()
+    if prev_hash is not None:
+        h.update(prev_hash.encode("utf-8"))
+    else:
+        h.update(_nodes_digest(nodes, node_digest_cache))
+
+    if transform_str is None:
+        transform_str = get_transformation_str(transformation)
 
-    return sha256((nodes_str + transform_string).encode("utf-8")).hexdigest()
+    h.update(transform_str.encode("utf-8"))
+    return f"{_CACHE_KEY_VERSION}-{h.hexdigest()}"
 
 
 def run_transformations(
@@ -62,6 +144,7 @@ def run_transformations(
     in_place: bool = True,
     cache: Optional[IngestionCache] = None,
     cache_collection: Optional[str] = None,
+    transform_strs: Optional[Sequence[str]] = None,
     **kwargs: Any,
 ) -> List[BaseNode]:
     """Run a series of transformations on a set of nodes.
@@ -69,23 +152,56 @@ def run_transformations(
     Args:
         nodes: The nodes to transform.
         transformations: The transformations to apply to the nodes.
+        transform_strs: Optional precomputed stable strings for each
+            transformation (see `get_transformation_str`), skipping
+            re-serialization when hashing for the cache.
 
     Returns:
         The transformed nodes.
     """
-    if not in_place:
+    # each transformation returns a fresh list rather than mutating the one
+    # passed in, so a defensive copy is only needed when there are none
+    if not in_place and not transformations:
         nodes = list(nodes)
 
-    for transform in transformations:
-        if cache is not None:
-            hash = get_transformation_hash(nodes, transform)
-            cached_nodes = cache.get(hash, collection=cache_collection)
+    if cache is not None and transformations:
+        # hash chaining makes every step's key computable up front, so all
+        # lookups can go to the cache in a single batched call
+        node_digest_cache: Dict[str, bytes] = {}
+        prev_step_hash: Optional[str] = None
+        hashes: List[str] = []
+        for i, transform in enumerate(transformations):
+            transform_str = (
+                transform_strs[i]
+                if transform_strs is not None
+                else get_transformation_str(transform)
+            )
+            prev_step_hash = get_transformation_hash(
+                nodes,
+                transform,
+                node_digest_cache=node_digest_cache,
+                prev_hash=prev_step_hash,
+                transform_str=transform_str,
+            )
+            hashes.append(prev_step_hash)
+
+        cached_node_lists = cache.mget(hashes, collection=cache_collection)
+
+        hits = misses = 0
+        for hash, cached_nodes, transform in zip(
+            hashes, cached_node_lists, transformations
+        ):
             if cached_nodes is not None:
+                hits += 1
                 nodes = cached_nodes
             else:
+                misses += 1
                 nodes = transform(nodes, **kwargs)
                 cache.put(hash, nodes, collection=cache_collection)
-        else:
+
+        logger.info("IngestionPipeline cache: %d hits, %d misses", hits, misses)
+    else:
+        for transform in transformations:
             nodes = transform(nodes, **kwargs)
 
     return nodes
@@ -97,6 +213,7 @@ async def arun_transformations(
     in_place: bool = True,
     cache: Optional[IngestionCache] = None,
     cache_collection: Optional[str] = None,
+    transform_strs: Optional[Sequence[str]] = None,
     **kwargs: Any,
 ) -> List[BaseNode]:
     """Run a series of transformations on a set of nodes.
@@ -104,24 +221,61 @@ async def arun_transformations(
     Args:
         nodes: The nodes to transform.
         transformations: The transformations to apply to the nodes.
+        transform_strs: Optional precomputed stable strings for each
+            transformation (see `get_transformation_str`), skipping
+            re-serialization when hashing for the cache.
 
     Returns:
         The transformed nodes.
     """
-    if not in_place:
+    # each transformation returns a fresh list rather than mutating the one
+    # passed in, so a defensive copy is only needed when there are none
+    if not in_place and not transformations:
         nodes = list(nodes)
 
-    for transform in transformations:
-        if cache is not None:
-            hash = get_transformation_hash(nodes, transform)
+    if cache is not None and transformations:
+        # hash chaining makes every step's key computable up front, so all
+        # lookups can go to the cache in a single batched call; hashing the
+        # node contents is CPU-bound, so push it off the event loop
+        node_digest_cache: Dict[str, bytes] = {}
+        prev_step_hash: Optional[str] = None
+        hashes: List[str] = []
+        for i, transform in enumerate(transformations):
+            transform_str = (
+                transform_strs[i]
+                if transform_strs is not None
+                else get_transformation_str(transform)
+            )
+            prev_step_hash = await asyncio.get_event_loop().run_in_executor(
+                None,
+                partial(
+                    get_transformation_hash,
+                    nodes,
+                    transform,
+                    node_digest_cache=node_digest_cache,
+                    prev_hash=prev_step_hash,
+                    transform_str=transform_str,
+                ),
+            )
+            hashes.append(prev_step_hash)
 
-            cached_nodes = cache.get(hash, collection=cache_collection)
+        cached_node_lists = await cache.amget(hashes, collection=cache_collection)
+
+        hits = misses = 0
+        for hash, cached_nodes, transform in zip(
+            hashes, cached_node_lists, transformations
+        ):
             if cached_nodes is not None:
+                hits += 1
                 nodes = cached_nodes
             else:
+                misses += 1
                 nodes = await transform.acall(nodes, **kwargs)
-                cache.put(hash, nodes, collection=cache_collection)
-        else:
+                await cache.aput(hash, nodes, collection=cache_collection)
+
+        logger.info("IngestionPipeline cache: %d hits, %d misses", hits, misses)
+    else:
+        for transform in transformations:
             nodes = await transform.acall(nodes, **kwargs)
 
     return nodes
@@ -133,6 +287,7 @@ def arun_transformations_wrapper(
     in_place: bool = True,
     cache: Optional[IngestionCache] = None,
     cache_collection: Optional[str] = None,
+    transform_strs: Optional[Sequence[str]] = None,
     **kwargs: Any,
 ) -> List[BaseNode]:
     """Wrapper for async run_transformation. To be used in loop.run_in_executor
@@ -146,6 +301,7 @@ def arun_transformations_wrapper(
             in_place=in_place,
             cache=cache,
             cache_collection=cache_collection,
+            transform_strs=transform_strs,
             **kwargs,
         )
     )
@@ -153,6 +309,10 @@ def arun_transformations_wrapper(
     return nodes
 
 
+# max number of concurrent async vector store add requests
+DEFAULT_ADD_CONCURRENCY = 4
+
+
 class DocstoreStrategy(str, Enum):
     """Document de-duplication strategy."""
 
@@ -185,10 +345,22 @@ class IngestionPipeline(BaseModel):
         default=DocstoreStrategy.UPSERTS, description="Document de-dup strategy."
     )
     disable_cache: bool = Field(default=False, description="Disable the cache")
+    dedup_inputs: bool = Field(
+        default=False,
+        description="Drop input nodes with exactly duplicated content before "
+        "transforming, skipping redundant embedding and vector store IO.",
+    )
 
     class Config:
         arbitrary_types_allowed = True
 
+    # stable strings for the configured transformations, keyed on object id;
+    # each value pins the transformation itself so a recycled id from a
+    # swapped-out transformation can never alias a stale entry
+    _transform_str_cache: Dict[int, Tuple[TransformComponent, str]] = PrivateAttr(
+        default_factory=dict
+    )
+
     def __init__(
         self,
         transformations: Optional[List[TransformComponent]] = None,
@@ -199,6 +371,7 @@ class IngestionPipeline(BaseModel):
         docstore: Optional[BaseDocumentStore] = None,
         docstore_strategy: DocstoreStrategy = DocstoreStrategy.UPSERTS,
         disable_cache: bool = False,
+        dedup_inputs: bool = False,
     ) -> None:
         if transformations is None:
             transformations = self._get_default_transformations()
@@ -212,8 +385,12 @@ class IngestionPipeline(BaseModel):
             docstore=docstore,
             docstore_strategy=docstore_strategy,
             disable_cache=disable_cache,
+            dedup_inputs=dedup_inputs,
         )
 
+        if not disable_cache:
+            self._get_transform_strs()
+
     def persist(
         self,
         persist_dir: str = "./pipeline_storage",
@@ -267,29 +444,35 @@ class IngestionPipeline(BaseModel):
 
     def _prepare_inputs(
         self, documents: Optional[List[Document]], nodes: Optional[List[BaseNode]]
-    ) -> List[Document]:
-        input_nodes: List[BaseNode] = []
+    ) -> Iterable[BaseNode]:
+        """Chain the configured inputs into a single lazy iterable.
+
+        Reader output is consumed lazily, so documents are only pulled into
+        memory as they are processed instead of all up front.
+        """
+        inputs: List[Iterable[BaseNode]] = []
         if documents is not None:
-            input_nodes += documents
+            inputs.append(documents)
 
         if nodes is not None:
-            input_nodes += nodes
+            inputs.append(nodes)
 
         if self.documents is not None:
-            input_nodes += self.documents
+            inputs.append(self.documents)
 
         if self.reader is not None:
-            input_nodes += self.reader.read()
+            inputs.append(self.reader.lazy_read())
 
-        return input_nodes
+        return chain.from_iterable(inputs)
 
     def _handle_duplicates(
         self,
-        nodes: List[BaseNode],
+        nodes: Iterable[BaseNode],
         store_doc_text: bool = True,
     ) -> List[BaseNode]:
         """Handle docstore duplicates by checking all hashes."""
-        assert self.docstore is not None
+        if self.docstore is None:
+            raise ValueError("docstore is required for de-duping nodes.")
 
         existing_hashes = self.docstore.get_all_document_hashes()
         current_hashes = []
@@ -306,11 +489,12 @@ class IngestionPipeline(BaseModel):
 
     def _handle_upserts(
         self,
-        nodes: List[BaseNode],
+        nodes: Iterable[BaseNode],
         store_doc_text: bool = True,
     ) -> List[BaseNode]:
         """Handle docstore upserts by checking hashes and ids."""
-        assert self.docstore is not None
+        if self.docstore is None:
+            raise ValueError("docstore is required for de-duping nodes.")
 
         existing_doc_ids_before = set(self.docstore.get_all_document_hashes().values())
         doc_ids_from_nodes = set()
@@ -358,6 +542,85 @@ class IngestionPipeline(BaseModel):
         for i in range(0, len(nodes), batch_size):
             yield nodes[i : i + batch_size]
 
+    def _get_transform_strs(self) -> List[str]:
+        """Get stable strings for the current transformations, memoized.
+
+        The memo is rebuilt against the current `self.transformations` on
+        every call, so reassigning the list drops entries for removed
+        transformations and serializes new ones fresh. Entries go stale only
+        if a transformation object is mutated in place after being added to
+        the pipeline, which is not supported.
+        """
+        new_cache: Dict[int, Tuple[TransformComponent, str]] = {}
+        transform_strs = []
+        for transform in self.transformations:
+            key = id(transform)
+            entry = self._transform_str_cache.get(key)
+            if entry is None or entry[0] is not transform:
+                entry = (transform, get_transformation_str(transform))
+            new_cache[key] = entry
+            transform_strs.append(entry[1])
+
+        self._transform_str_cache = new_cache
+        return transform_strs
+
+    @staticmethod
+    def _dedup_nodes(nodes: Iterable[BaseNode]) -> Generator[BaseNode, Any, Any]:
+        """Drop nodes whose content exactly duplicates an earlier node's."""
+        seen: Set[bytes] = set()
+        for node in nodes:
+            digest = _hasher(
+                node.get_content(metadata_mode=MetadataMode.ALL).encode(
+                    "utf-8", "ignore"
+                )
+            ).digest()
+            if digest not in seen:
+                seen.add(digest)
+                yield node
+
+    def _vector_store_add(self, nodes: List[BaseNode], batch_size: int) -> None:
+        """Add embedded nodes to the vector store in bounded-size batches."""
+        if self.vector_store is None:
+            raise ValueError("vector_store is not set.")
+
+        embedded_nodes = [n for n in nodes if n.embedding is not None]
+        for batch in self._batch_nodes(embedded_nodes, batch_size):
+            self.vector_store.add(batch)
+
+    async def _avector_store_add(self, nodes: List[BaseNode], batch_size: int) -> None:
+        """Add embedded nodes to the vector store in bounded-size batches.
+
+        Batches are added concurrently, with at most DEFAULT_ADD_CONCURRENCY
+        requests in flight at once.
+        """
+        if self.vector_store is None:
+            raise ValueError("vector_store is not set.")
+
+        embedded_nodes = [n for n in nodes if n.embedding is not None]
+        semaphore = asyncio.Semaphore(DEFAULT_ADD_CONCURRENCY)
+
+        async def _add(batch: List[BaseNode]) -> None:
+            async with semaphore:
+                await self.vector_store.async_add(batch)
+
+        await asyncio.gather(
+            *[_add(batch) for batch in self._batch_nodes(embedded_nodes, batch_size)]
+        )
+
+    @staticmethod
+    def _batch_nodes(
+        nodes: Iterable[BaseNode], batch_size: int
+    ) -> Generator[List[BaseNode], Any, Any]:
+        """Yield batch_size-sized chunks from a (possibly lazy) node iterable."""
+        batch: List[BaseNode] = []
+        for node in nodes:
+            batch.append(node)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     def run(
         self,
         show_progress: bool = False,
@@ -367,6 +630,7 @@ class IngestionPipeline(BaseModel):
         in_place: bool = True,
         store_doc_text: bool = True,
         num_workers: Optional[int] = None,
+        batch_size: int = 256,
         **kwargs: Any,
     ) -> Sequence[BaseNode]:
         """
@@ -379,6 +643,9 @@ class IngestionPipeline(BaseModel):
                 array passed to `run_transformations`. Defaults to True.
             num_workers (Optional[int], optional): The number of parallel processes to use.
                 If set to None, then sequential compute is used. Defaults to None.
+            batch_size (int, optional): The number of input nodes streamed through the
+                transformations (and into the vector store) at a time, bounding peak
+                memory. Defaults to 256.
 
         Returns:
             Sequence[BaseNode]: The set of transformed Nodes/Documents
@@ -420,6 +687,11 @@ class IngestionPipeline(BaseModel):
         else:
             nodes_to_run = input_nodes
 
+        if self.dedup_inputs:
+            nodes_to_run = self._dedup_nodes(nodes_to_run)
+
+        transform_strs = None if self.disable_cache else self._get_transform_strs()
+
         if num_workers and num_workers > 1:
             if num_workers > multiprocessing.cpu_count():
                 warnings.warn(
@@ -429,7 +701,7 @@ class IngestionPipeline(BaseModel):
 
             with multiprocessing.get_context("spawn").Pool(num_workers) as p:
                 node_batches = self._node_batcher(
-                    num_batches=num_workers, nodes=nodes_to_run
+                    num_batches=num_workers, nodes=list(nodes_to_run)
                 )
                 nodes_parallel = p.starmap(
                     run_transformations,
@@ -439,22 +711,31 @@ class IngestionPipeline(BaseModel):
                         repeat(in_place),
                         repeat(self.cache if not self.disable_cache else None),
                         repeat(cache_collection),
+                        repeat(transform_strs),
                     ),
                 )
                 nodes = reduce(lambda x, y: x + y, nodes_parallel, [])
-        else:
-            nodes = run_transformations(
-                nodes_to_run,
-                self.transformations,
-                show_progress=show_progress,
-                cache=self.cache if not self.disable_cache else None,
-                cache_collection=cache_collection,
-                in_place=in_place,
-                **kwargs,
-            )
 
-        if self.vector_store is not None:
-            self.vector_store.add([n for n in nodes if n.embedding is not None])
+            if self.vector_store is not None:
+                self._vector_store_add(nodes, batch_size)
+        else:
+            # stream the inputs through the transformations batch by batch,
+            # adding to the vector store as each batch completes
+            nodes = []
+            for batch in self._batch_nodes(nodes_to_run, batch_size):
+                batch_nodes = run_transformations(
+                    batch,
+                    self.transformations,
+                    show_progress=show_progress,
+                    cache=self.cache if not self.disable_cache else None,
+                    cache_collection=cache_collection,
+                    transform_strs=transform_strs,
+                    in_place=in_place,
+                    **kwargs,
+                )
+                if self.vector_store is not None:
+                    self._vector_store_add(batch_nodes, batch_size)
+                nodes.extend(batch_nodes)
 
         return nodes
 
@@ -462,11 +743,12 @@ class IngestionPipeline(BaseModel):
 
     async def _ahandle_duplicates(
         self,
-        nodes: List[BaseNode],
+        nodes: Iterable[BaseNode],
         store_doc_text: bool = True,
     ) -> List[BaseNode]:
         """Handle docstore duplicates by checking all hashes."""
-        assert self.docstore is not None
+        if self.docstore is None:
+            raise ValueError("docstore is required for de-duping nodes.")
 
         existing_hashes = await self.docstore.aget_all_document_hashes()
         current_hashes = []
@@ -483,11 +765,12 @@ class IngestionPipeline(BaseModel):
 
     async def _ahandle_upserts(
         self,
-        nodes: List[BaseNode],
+        nodes: Iterable[BaseNode],
         store_doc_text: bool = True,
     ) -> List[BaseNode]:
         """Handle docstore upserts by checking hashes and ids."""
-        assert self.docstore is not None
+        if self.docstore is None:
+            raise ValueError("docstore is required for de-duping nodes.")
 
         existing_doc_ids_before = set(
             (await self.docstore.aget_all_document_hashes()).values()
@@ -537,6 +820,7 @@ class IngestionPipeline(BaseModel):
         in_place: bool = True,
         store_doc_text: bool = True,
         num_workers: Optional[int] = None,
+        batch_size: int = 256,
         **kwargs: Any,
     ) -> Sequence[BaseNode]:
         input_nodes = self._prepare_inputs(documents, nodes)
@@ -576,6 +860,11 @@ class IngestionPipeline(BaseModel):
         else:
             nodes_to_run = input_nodes
 
+        if self.dedup_inputs:
+            nodes_to_run = self._dedup_nodes(nodes_to_run)
+
+        transform_strs = None if self.disable_cache else self._get_transform_strs()
+
         if num_workers and num_workers > 1:
             if num_workers > multiprocessing.cpu_count():
                 warnings.warn(
@@ -586,7 +875,7 @@ class IngestionPipeline(BaseModel):
             loop = asyncio.get_event_loop()
             with ProcessPoolExecutor(max_workers=num_workers) as p:
                 node_batches = self._node_batcher(
-                    num_batches=num_workers, nodes=nodes_to_run
+                    num_batches=num_workers, nodes=list(nodes_to_run)
                 )
                 tasks = [
                     loop.run_in_executor(
@@ -597,6 +886,7 @@ class IngestionPipeline(BaseModel):
                             in_place=in_place,
                             cache=self.cache if not self.disable_cache else None,
                             cache_collection=cache_collection,
+                            transform_strs=transform_strs,
                         ),
                         batch,
                     )
@@ -604,20 +894,26 @@ class IngestionPipeline(BaseModel):
                 ]
                 result: List[List[BaseNode]] = await asyncio.gather(*tasks)
                 nodes = reduce(lambda x, y: x + y, result, [])
-        else:
-            nodes = await arun_transformations(
-                nodes_to_run,
-                self.transformations,
-                show_progress=show_progress,
-                cache=self.cache if not self.disable_cache else None,
-                cache_collection=cache_collection,
-                in_place=in_place,
-                **kwargs,
-            )
 
-        if self.vector_store is not None:
-            await self.vector_store.async_add(
-                [n for n in nodes if n.embedding is not None]
-            )
+            if self.vector_store is not None:
+                await self._avector_store_add(nodes, batch_size)
+        else:
+            # stream the inputs through the transformations batch by batch,
+            # adding to the vector store as each batch completes
+            nodes = []
+            for batch in self._batch_nodes(nodes_to_run, batch_size):
+                batch_nodes = await arun_transformations(
+                    batch,
+                    self.transformations,
+                    show_progress=show_progress,
+                    cache=self.cache if not self.disable_cache else None,
+                    cache_collection=cache_collection,
+                    transform_strs=transform_strs,
+                    in_place=in_place,
+                    **kwargs,
+                )
+                if self.vector_store is not None:
+                    await self._avector_store_add(batch_nodes, batch_size)
+                nodes.extend(batch_nodes)
 
         return nodes
@@ -68,3 +68,12 @@ class ReaderConfig(BaseComponent):
     def read(self) -> List[Document]:
         """Call the loader with the given arguments."""
         return self.reader.load_data(*self.reader_args, **self.reader_kwargs)
+
+    def lazy_read(self) -> Iterable[Document]:
+        """Call the loader lazily, falling back to an eager read."""
+        try:
+            yield from self.reader.lazy_load_data(
+                *self.reader_args, **self.reader_kwargs
+            )
+        except NotImplementedError:
+            yield from self.reader.load_data(*self.reader_args, **self.reader_kwargs)
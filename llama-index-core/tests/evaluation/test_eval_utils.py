@@ -0,0 +1,117 @@
+import asyncio
+from typing import Any, List, Optional, Sequence
+
+import pytest
+from llama_index.core.base.base_query_engine import BaseQueryEngine
+from llama_index.core.base.response.schema import RESPONSE_TYPE, Response
+from llama_index.core.evaluation.base import EvaluationResult
+from llama_index.core.evaluation.eval_utils import (
+    aget_responses,
+    get_responses,
+    get_results_df,
+)
+from llama_index.core.prompts.mixin import PromptDictType
+from llama_index.core.schema import NodeWithScore, QueryBundle
+
+
+class MockQueryEngine(BaseQueryEngine):
+    """Mock query engine that tracks how many queries are in flight."""
+
+    def __init__(self) -> None:
+        super().__init__(callback_manager=None)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _get_prompt_modules(self) -> PromptDictType:
+        return {}
+
+    def _query(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
+        return Response(response=f"response to {query_bundle.query_str}")
+
+    async def _aquery(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return Response(response=f"response to {query_bundle.query_str}")
+
+    def retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        return []
+
+    def synthesize(
+        self,
+        query_bundle: QueryBundle,
+        nodes: List[NodeWithScore],
+        additional_source_nodes: Optional[Sequence[NodeWithScore]] = None,
+    ) -> RESPONSE_TYPE:
+        return Response(response="")
+
+    async def asynthesize(
+        self,
+        query_bundle: QueryBundle,
+        nodes: List[NodeWithScore],
+        additional_source_nodes: Optional[Sequence[NodeWithScore]] = None,
+    ) -> RESPONSE_TYPE:
+        return Response(response="")
+
+
+@pytest.mark.asyncio()
+async def test_aget_responses_preserves_order() -> None:
+    query_engine = MockQueryEngine()
+    questions = [f"question {i}" for i in range(20)]
+
+    responses = await aget_responses(questions, query_engine)
+    assert [str(response) for response in responses] == [
+        f"response to {question}" for question in questions
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_aget_responses_bounds_concurrency() -> None:
+    query_engine = MockQueryEngine()
+    questions = [f"question {i}" for i in range(20)]
+
+    await aget_responses(questions, query_engine, max_concurrency=5)
+    assert query_engine.max_in_flight <= 5
+
+
+def test_get_responses() -> None:
+    query_engine = MockQueryEngine()
+    questions = ["question 0", "question 1"]
+
+    responses = get_responses(questions, query_engine)
+    assert [str(response) for response in responses] == [
+        "response to question 0",
+        "response to question 1",
+    ]
+
+
+def _result(score: float) -> EvaluationResult:
+    return EvaluationResult(score=score)
+
+
+def test_get_results_df() -> None:
+    eval_results_list: List[Any] = [
+        {"correctness": [_result(1.0), _result(0.0)], "relevancy": [_result(0.5)]},
+        {"correctness": [_result(1.0)], "relevancy": [_result(1.0), _result(0.5)]},
+    ]
+
+    df = get_results_df(
+        eval_results_list, ["gpt-4", "gpt-3.5"], ["correctness", "relevancy"]
+    )
+    assert list(df.columns) == ["names", "correctness", "relevancy"]
+    assert df["names"].tolist() == ["gpt-4", "gpt-3.5"]
+    assert df["correctness"].tolist() == [0.5, 1.0]
+    assert df["relevancy"].tolist() == [0.5, 0.75]
+
+
+def test_get_results_df_duplicate_names() -> None:
+    eval_results_list: List[Any] = [
+        {"correctness": [_result(1.0)]},
+        {"correctness": [_result(0.0)]},
+    ]
+
+    # duplicate names keep their own rows instead of being pooled
+    df = get_results_df(eval_results_list, ["gpt-4", "gpt-4"], ["correctness"])
+    assert df["names"].tolist() == ["gpt-4", "gpt-4"]
+    assert df["correctness"].tolist() == [1.0, 0.0]
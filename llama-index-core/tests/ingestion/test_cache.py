@@ -1,5 +1,6 @@
 from typing import Any, List
 
+import pytest
 from llama_index.core.ingestion import IngestionCache
 from llama_index.core.ingestion.pipeline import get_transformation_hash
 from llama_index.core.schema import BaseNode, TextNode, TransformComponent
@@ -45,3 +46,72 @@ def test_cache_clear() -> None:
 
     cache.clear()
     assert cache.get(hash) is None
+
+
+@pytest.mark.asyncio()
+async def test_cache_async() -> None:
+    cache = IngestionCache()
+    transformation = DummyTransform()
+
+    node = TextNode(text="dummy")
+    hash = get_transformation_hash([node], transformation)
+
+    new_nodes = transformation([node])
+    await cache.aput(hash, new_nodes)
+
+    cache_hit = await cache.aget(hash)
+    assert cache_hit is not None
+    assert cache_hit[0].get_content() == new_nodes[0].get_content()
+
+    new_hash = get_transformation_hash(new_nodes, transformation)
+    assert await cache.aget(new_hash) is None
+
+
+def test_cache_mget() -> None:
+    cache = IngestionCache()
+    cache.put("hash1", [TextNode(text="one")])
+    cache.put("hash2", [TextNode(text="two")])
+
+    cache_hits = cache.mget(["hash1", "missing", "hash2"])
+    assert cache_hits[0] is not None
+    assert cache_hits[0][0].get_content() == "one"
+    assert cache_hits[1] is None
+    assert cache_hits[2] is not None
+    assert cache_hits[2][0].get_content() == "two"
+
+
+@pytest.mark.asyncio()
+async def test_cache_amget() -> None:
+    cache = IngestionCache()
+    cache.put("hash1", [TextNode(text="one")])
+
+    cache_hits = await cache.amget(["hash1", "missing"])
+    assert cache_hits[0] is not None
+    assert cache_hits[0][0].get_content() == "one"
+    assert cache_hits[1] is None
+
+
+def test_cache_local_lru_bounded() -> None:
+    cache = IngestionCache(local_cache_size=2)
+    for i in range(3):
+        cache.put(f"hash{i}", [TextNode(text=str(i))])
+
+    assert len(cache._local_cache) == 2
+
+    # evicted keys are still served from the backing store
+    cache_hit = cache.get("hash0")
+    assert cache_hit is not None
+    assert cache_hit[0].get_content() == "0"
+
+
+def test_cache_local_hits_are_isolated() -> None:
+    cache = IngestionCache()
+    cache.put("hash", [TextNode(text="original")])
+
+    cache_hit = cache.get("hash")
+    assert cache_hit is not None
+    cache_hit[0].set_content("mutated")
+
+    cache_hit = cache.get("hash")
+    assert cache_hit is not None
+    assert cache_hit[0].get_content() == "original"
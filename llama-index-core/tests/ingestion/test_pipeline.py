@@ -1,12 +1,18 @@
 from multiprocessing import cpu_count
+from typing import Any, List
 
+import pytest
 from llama_index.core.embeddings.mock_embed_model import MockEmbedding
 from llama_index.core.extractors import KeywordExtractor
-from llama_index.core.ingestion.pipeline import IngestionPipeline
+from llama_index.core.ingestion.cache import IngestionCache
+from llama_index.core.ingestion.pipeline import (
+    IngestionPipeline,
+    get_transformation_hash,
+)
 from llama_index.core.llms.mock import MockLLM
 from llama_index.core.node_parser import SentenceSplitter
 from llama_index.core.readers import ReaderConfig, StringIterableReader
-from llama_index.core.schema import Document
+from llama_index.core.schema import BaseNode, Document, TextNode, TransformComponent
 from llama_index.core.storage.docstore import SimpleDocumentStore
 
 
@@ -17,6 +23,26 @@ def teardown_function() -> None:
     shutil.rmtree("./test_pipeline", ignore_errors=True)
 
 
+# records the size of each batch of nodes it is called with
+_transform_batches: List[int] = []
+
+
+class CountingTransform(TransformComponent):
+    @classmethod
+    def class_name(cls) -> str:
+        return "CountingTransform"
+
+    def __call__(self, nodes: List[BaseNode], **kwargs: Any) -> List[BaseNode]:
+        _transform_batches.append(len(nodes))
+        return [
+            TextNode(
+                text=node.get_content() + "\nTESTTEST",
+                id_=node.node_id + "-transformed",
+            )
+            for node in nodes
+        ]
+
+
 def test_build_pipeline() -> None:
     pipeline = IngestionPipeline(
         reader=ReaderConfig(
@@ -160,3 +186,122 @@ def test_pipeline_parallel() -> None:
     assert len(nodes) == 20
     assert pipeline.docstore is not None
     assert len(pipeline.docstore.docs) == 2
+
+
+def test_transformation_hash_chaining() -> None:
+    nodes: List[BaseNode] = [TextNode(text="one"), TextNode(text="two")]
+    transformation = CountingTransform()
+
+    hash = get_transformation_hash(nodes, transformation)
+    assert hash.startswith("v3-")
+    assert hash == get_transformation_hash(nodes, transformation)
+
+    # changing the input content changes the hash
+    changed_nodes: List[BaseNode] = [TextNode(text="one"), TextNode(text="changed")]
+    assert get_transformation_hash(changed_nodes, transformation) != hash
+
+    # chained hashes fold the previous step's key instead of the nodes,
+    # so the same prefix always yields the same key
+    chained = get_transformation_hash(nodes, transformation, prev_hash=hash)
+    assert chained == get_transformation_hash(
+        changed_nodes, transformation, prev_hash=hash
+    )
+    assert chained != hash
+
+
+def test_pipeline_cache_rerun_hits() -> None:
+    _transform_batches.clear()
+    documents = [
+        Document(text="one", doc_id="1"),
+        Document(text="two", doc_id="2"),
+    ]
+
+    pipeline = IngestionPipeline(
+        transformations=[CountingTransform()],
+        cache=IngestionCache(),
+    )
+
+    nodes = pipeline.run(documents=documents)
+    assert len(_transform_batches) == 1
+
+    # identical re-run is served entirely from the cache
+    cached_nodes = pipeline.run(documents=documents)
+    assert len(_transform_batches) == 1
+    assert [n.get_content() for n in cached_nodes] == [n.get_content() for n in nodes]
+
+
+def test_pipeline_cache_miss_on_changed_input() -> None:
+    _transform_batches.clear()
+    pipeline = IngestionPipeline(
+        transformations=[CountingTransform()],
+        cache=IngestionCache(),
+    )
+
+    pipeline.run(documents=[Document(text="one", doc_id="1")])
+    pipeline.run(documents=[Document(text="changed", doc_id="1")])
+    assert len(_transform_batches) == 2
+
+
+@pytest.mark.asyncio()
+async def test_pipeline_async_cache_rerun_hits() -> None:
+    _transform_batches.clear()
+    documents = [Document(text="one", doc_id="1")]
+
+    pipeline = IngestionPipeline(
+        transformations=[CountingTransform()],
+        cache=IngestionCache(),
+    )
+
+    nodes = await pipeline.arun(documents=documents)
+    assert len(_transform_batches) == 1
+
+    cached_nodes = await pipeline.arun(documents=documents)
+    assert len(_transform_batches) == 1
+    assert [n.get_content() for n in cached_nodes] == [n.get_content() for n in nodes]
+
+
+def test_pipeline_dedup_inputs() -> None:
+    documents = [
+        Document(text="same", doc_id="1"),
+        Document(text="same", doc_id="2"),
+        Document(text="other", doc_id="3"),
+    ]
+
+    pipeline = IngestionPipeline(
+        transformations=[CountingTransform()],
+        dedup_inputs=True,
+        disable_cache=True,
+    )
+    nodes = pipeline.run(documents=documents)
+    assert len(nodes) == 2
+
+    # duplicates are kept by default
+    pipeline = IngestionPipeline(
+        transformations=[CountingTransform()],
+        disable_cache=True,
+    )
+    nodes = pipeline.run(documents=documents)
+    assert len(nodes) == 3
+
+
+def test_pipeline_batch_size() -> None:
+    _transform_batches.clear()
+    documents = [Document(text=f"doc {i}", doc_id=str(i)) for i in range(5)]
+
+    pipeline = IngestionPipeline(
+        transformations=[CountingTransform()],
+        disable_cache=True,
+    )
+
+    nodes = pipeline.run(documents=documents, batch_size=2)
+    assert len(nodes) == 5
+    assert _transform_batches == [2, 2, 1]
+
+
+def test_reader_config_lazy_read() -> None:
+    reader = ReaderConfig(
+        reader=StringIterableReader(), reader_kwargs={"texts": ["one", "two"]}
+    )
+
+    docs = list(reader.lazy_read())
+    assert [doc.get_content() for doc in docs] == ["one", "two"]